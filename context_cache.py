@@ -1,6 +1,31 @@
+import hashlib
+import json
+import os
 import time
 from typing import Any, Dict, List, Optional, Tuple, Set
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# {account} is replaced with a digest of MNOTIFY_API_KEY so caches from
+# different accounts never mix (stale IDs from another account could be
+# passed straight into send calls otherwise).
+_DEFAULT_CACHE_PATH = "~/.mnotify_cache.{account}.json"
+# Per-kind cap for persisted entities; oldest entries (by __updated_at) are
+# evicted first so the file stays small and fresh.
+_MAX_PERSISTED_PER_KIND = 500
+
+
+def _account_cache_path(template: str) -> Optional[str]:
+    """Fill the {account} slot from MNOTIFY_API_KEY; None when the key is unset."""
+    key = os.getenv("MNOTIFY_API_KEY")
+    if not key:
+        return None
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+    return template.format(account=digest)
+
 
 def _normalize(text: Optional[str]) -> str:
     if not isinstance(text, str):
@@ -22,9 +47,17 @@ class EntityCache:
 
     This does not expose any state to the LLM by default. Use
     get_memory_lines_and_reset() to generate tiny breadcrumbs when helpful.
+
+    Known entities are persisted to a small JSON file keyed by the MNotify
+    account (default ~/.mnotify_cache.<digest>.json, where the digest comes
+    from MNOTIFY_API_KEY), so yesterday's group/template/contact IDs are
+    available on the first turn of a new session without re-fetching the
+    list endpoints — and switching accounts never seeds a session with
+    another account's IDs. Pass path=None for a purely in-memory cache;
+    when MNOTIFY_API_KEY is unset the cache stays in-memory too.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, path: Optional[str] = _DEFAULT_CACHE_PATH) -> None:
         now = time.time()
         # Groups
         self.groups_by_id: Dict[str, Dict[str, Any]] = {}
@@ -57,6 +90,84 @@ class EntityCache:
 
         self._updated_at = now
 
+        if path and "{account}" in path:
+            path = _account_cache_path(path)
+        self._path = os.path.expanduser(path) if path else None
+        if self._path:
+            self._load()
+
+    # ------------------------ Persistence ------------------------
+
+    def _load(self) -> None:
+        try:
+            with open(self._path, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        try:
+            self.groups_by_id.update(data.get("groups_by_id") or {})
+            self.contacts_by_id.update(data.get("contacts_by_id") or {})
+            self.templates_by_id.update(data.get("templates_by_id") or {})
+            self.campaigns_by_id.update(data.get("campaigns_by_id") or {})
+            self.sender_ids_by_name.update(data.get("sender_ids_by_name") or {})
+            for target, key in (
+                (self.group_ids_by_name, "group_ids_by_name"),
+                (self.contact_ids_by_phone, "contact_ids_by_phone"),
+                (self.contact_ids_by_fullname, "contact_ids_by_fullname"),
+                (self.template_ids_by_title, "template_ids_by_title"),
+            ):
+                for name, ids in (data.get(key) or {}).items():
+                    if isinstance(ids, list):
+                        target.setdefault(name, set()).update(str(i) for i in ids)
+        except Exception:
+            # Corrupt or stale file shape; keep whatever loaded cleanly
+            return
+
+    @staticmethod
+    def _evicted(by_id: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        if len(by_id) <= _MAX_PERSISTED_PER_KIND:
+            return by_id
+        ordered = sorted(by_id.items(), key=lambda kv: kv[1].get("__updated_at", 0), reverse=True)
+        return dict(ordered[:_MAX_PERSISTED_PER_KIND])
+
+    def save(self) -> None:
+        """Write known entities to disk (no-op for in-memory caches)."""
+        if not self._path:
+            return
+        data = {
+            "groups_by_id": self._evicted(self.groups_by_id),
+            "contacts_by_id": self._evicted(self.contacts_by_id),
+            "templates_by_id": self._evicted(self.templates_by_id),
+            "campaigns_by_id": self._evicted(self.campaigns_by_id),
+            "sender_ids_by_name": self.sender_ids_by_name,
+            "group_ids_by_name": {k: sorted(v) for k, v in self.group_ids_by_name.items()},
+            "contact_ids_by_phone": {k: sorted(v) for k, v in self.contact_ids_by_phone.items()},
+            "contact_ids_by_fullname": {k: sorted(v) for k, v in self.contact_ids_by_fullname.items()},
+            "template_ids_by_title": {k: sorted(v) for k, v in self.template_ids_by_title.items()},
+        }
+        try:
+            raw = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+            tmp = self._path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, self._path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def clear(self) -> None:
+        """Drop both in-memory state and the on-disk cache file."""
+        path = self._path
+        self.__init__(path=None)
+        self._path = path
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
     # ------------------------ Indexing helpers ------------------------
 
     def _record_group(self, group_id: Optional[str], name: Optional[str], created: bool = False) -> None:
@@ -289,6 +400,8 @@ class EntityCache:
             # Avoid crashing on unexpected shapes
             return
 
+        self.save()
+
     def get_memory_lines_and_reset(self, max_pairs: int = 10) -> List[str]:
         lines: List[str] = []
         if self._delta_group_pairs:
@@ -1,7 +1,7 @@
+import asyncio
 import os
-import requests
+import httpx
 from dotenv import load_dotenv
-import time
 from typing import Optional
 
 
@@ -10,6 +10,28 @@ MAX_RETRIES = 3
 
 load_dotenv()
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_HTTP: Optional[httpx.AsyncClient] = None
+
+
+def _http() -> httpx.AsyncClient:
+    """Shared async HTTP client (connection pooling + keep-alive across calls)."""
+    global _HTTP
+    if _HTTP is None or _HTTP.is_closed:
+        _HTTP = httpx.AsyncClient(timeout=TIMEOUT)
+    return _HTTP
+
+
+def _loads(response: httpx.Response):
+    """Parse a response body with orjson when available (~3-10x faster)."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 base_url = 'https://api.mnotify.com/api'
 message_endPoint = 'https://api.mnotify.com/api/template' # template list endpoint
 group_endPoint = 'https://api.mnotify.com/api/group' # group list endpoint
@@ -19,7 +41,7 @@ schedule_sms_endPoint = 'https://api.mnotify.com/api/scheduled' # scheduled sms
 sender_id_endpoint = 'https://api.mnotify.com/api/senderid' # register sender id endpoint
 sms_balance_endPoint = 'https://api.mnotify.com/api/balance/sms' # sms balance endpoint
 
-def get_template_list():
+async def get_template_list():
     """
     Retrieve a list of all message templates from MNotify API.
     
@@ -65,20 +87,20 @@ def get_template_list():
     
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, timeout=TIMEOUT)
+            response = await _http().get(url)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response)
             return data
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             if attempt == MAX_RETRIES - 1:
                 return {"error": "Request timed out after multiple attempts"}
-            time.sleep(1)
-        except requests.exceptions.RequestException as e:
+            await asyncio.sleep(1)
+        except httpx.HTTPError as e:
             return {"error": f"Request failed: {str(e)}"}
         except Exception as e:
             return {"error": f"Unexpected error: {str(e)}"}
 
-def get_message_template(template_id: str):
+async def get_message_template(template_id: str):
     """
     Retrieve details of a specific message template.
     
@@ -114,11 +136,11 @@ def get_message_template(template_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = message_endPoint + '/' + template_id + '?key=' + apiKey
-    response = requests.get(url)
-    data = response.json()
+    response = await _http().get(url)
+    data = _loads(response)
     return data
 
-def add_message_template(title: str, content: str):
+async def add_message_template(title: str, content: str):
     """
     Create a new message template.
     
@@ -143,11 +165,11 @@ def add_message_template(title: str, content: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = message_endPoint + '?key=' + apiKey
-    response = requests.post(url, json={"title": title, "body": content})
-    data = response.json()
+    response = await _http().post(url, json={"title": title, "body": content})
+    data = _loads(response)
     return data
 
-def update_message_template(template_id: str, title: Optional[str] = None, content: Optional[str] = None):
+async def update_message_template(template_id: str, title: Optional[str] = None, content: Optional[str] = None):
     """
     Update an existing message template.
     
@@ -167,11 +189,11 @@ def update_message_template(template_id: str, title: Optional[str] = None, conte
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = message_endPoint + '/' + template_id + '?key=' + apiKey
-    response = requests.put(url, json={"title": title, "body": content, "id": template_id})
-    data = response.json()
+    response = await _http().put(url, json={"title": title, "body": content, "id": template_id})
+    data = _loads(response)
     return data
 
-def delete_message_template(template_id: str):  
+async def delete_message_template(template_id: str):  
     """
     Delete a message template.
     
@@ -189,11 +211,11 @@ def delete_message_template(template_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = message_endPoint + '/' + template_id + '?key=' + apiKey
-    response = requests.delete(url)
-    data = response.json()
+    response = await _http().delete(url)
+    data = _loads(response)
     return data
 
-def get_group_list():
+async def get_group_list():
     """
     Retrieve a list of all contact groups from MNotify API.
     
@@ -228,11 +250,11 @@ def get_group_list():
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = group_endPoint + '?key=' + apiKey
-    response = requests.get(url)
-    data = response.json()
+    response = await _http().get(url)
+    data = _loads(response)
     return data
 
-def get_group_details(group_id: str):
+async def get_group_details(group_id: str):
     """
     Retrieve details of a specific contact group.
     
@@ -263,11 +285,11 @@ def get_group_details(group_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = group_endPoint + '/' + group_id + '?key=' + apiKey
-    response = requests.get(url)
-    data = response.json()
+    response = await _http().get(url)
+    data = _loads(response)
     return data
 
-def add_group(group_name: str):
+async def add_group(group_name: str):
     """
     Create a new contact group.
     
@@ -291,11 +313,11 @@ def add_group(group_name: str):
     """ 
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = group_endPoint + '?key=' + apiKey
-    response = requests.post(url, json={"name": group_name})
-    data = response.json()
+    response = await _http().post(url, json={"name": group_name})
+    data = _loads(response)
     return data
 
-def update_group(group_id: str, group_name: str):
+async def update_group(group_id: str, group_name: str):
     """
     Update an existing contact group name.
     
@@ -315,11 +337,11 @@ def update_group(group_id: str, group_name: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = group_endPoint + '/' + group_id + '?key=' + apiKey
-    response = requests.put(url, json={"name": group_name})
-    data = response.json()
+    response = await _http().put(url, json={"name": group_name})
+    data = _loads(response)
     return data
 
-def delete_group(group_id: str):
+async def delete_group(group_id: str):
     """
     Delete a contact group.
     
@@ -338,11 +360,11 @@ def delete_group(group_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = group_endPoint + '/' + group_id + '?key=' + apiKey
-    response = requests.delete(url)
-    data = response.json()
+    response = await _http().delete(url)
+    data = _loads(response)
     return data
 
-def get_contact_list():
+async def get_contact_list():
     """
     Retrieve a list of all contacts from MNotify API.
     
@@ -407,11 +429,11 @@ def get_contact_list():
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = contact_endPoint + '?key=' + apiKey
-    response = requests.get(url)
-    data = response.json()
+    response = await _http().get(url)
+    data = _loads(response)
     return data
 
-def get_contact_details(contact_id: str):
+async def get_contact_details(contact_id: str):
     """
     Retrieve details of a specific contact.
     
@@ -436,11 +458,11 @@ def get_contact_details(contact_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = contact_endPoint + '/' + contact_id + '?key=' + apiKey
-    response = requests.get(url)
-    data = response.json()
+    response = await _http().get(url)
+    data = _loads(response)
     return data
 
-def get_group_contacts(group_id: str):
+async def get_group_contacts(group_id: str):
     """
     Retrieve all contacts belonging to a specific group.
     
@@ -477,11 +499,11 @@ def get_group_contacts(group_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = contact_endPoint + '/group/' + group_id + '?key=' + apiKey
-    response = requests.get(url)
-    data = response.json()
+    response = await _http().get(url)
+    data = _loads(response)
     return data
 
-def add_contact(group_id: str,  phone: str, first_name: Optional[str] = None, last_name: Optional[str] = None, dob: Optional[str] = None, email: Optional[str] = None):
+async def add_contact(group_id: str,  phone: str, first_name: Optional[str] = None, last_name: Optional[str] = None, dob: Optional[str] = None, email: Optional[str] = None):
     """
     Add a new contact to a specific group.
     
@@ -509,17 +531,17 @@ def add_contact(group_id: str,  phone: str, first_name: Optional[str] = None, la
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = contact_endPoint + '/' + group_id + '?key=' + apiKey
-    response = requests.post(url, json={"firstname": first_name, "lastname": last_name, "phone": phone, "dob": dob, "email": email, "group_id": group_id})
+    response = await _http().post(url, json={"firstname": first_name, "lastname": last_name, "phone": phone, "dob": dob, "email": email, "group_id": group_id})
     
     # Check if response is successful before trying to parse JSON
     if response.status_code == 200 or response.status_code == 201:
-        data = response.json()
+        data = _loads(response)
         return data
     else:
         print(f"Error: {response.status_code}")
         print(f"Response text: {response.text}")
 
-def update_contact(contact_id: str, phone: str, first_name: Optional[str] = None, last_name: Optional[str] = None, dob: Optional[str] = None, email: Optional[str] = None, group_id: Optional[str] = None):
+async def update_contact(contact_id: str, phone: str, first_name: Optional[str] = None, last_name: Optional[str] = None, dob: Optional[str] = None, email: Optional[str] = None, group_id: Optional[str] = None):
     """
     Update an existing contact's information.
     
@@ -549,11 +571,11 @@ def update_contact(contact_id: str, phone: str, first_name: Optional[str] = None
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = contact_endPoint + '/' + contact_id + '?key=' + apiKey
-    response = requests.put(url, json={"firstname": first_name, "lastname": last_name, "phone": phone, "dob": dob, "email": email, "group_id": group_id})
-    data = response.json()
+    response = await _http().put(url, json={"firstname": first_name, "lastname": last_name, "phone": phone, "dob": dob, "email": email, "group_id": group_id})
+    data = _loads(response)
     return data
 
-def delete_contact(contact_id: str):
+async def delete_contact(contact_id: str):
     """
     Delete a contact from the system.
     
@@ -572,15 +594,15 @@ def delete_contact(contact_id: str):
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = contact_endPoint + '/' + contact_id + '?key=' + apiKey
 
-    response = requests.delete(url)
+    response = await _http().delete(url)
     if response.status_code == 200:
-        data = response.json()
+        data = _loads(response)
         return data
     else:
         print(f"Error: {response.status_code}")
         print(f"Response text: {response.text}")
 
-def send_quick_bulk_sms(recipient: list, sender_id: str, message: str, schedule: Optional[bool] = False, schedule_time: Optional[str] = None):
+async def send_quick_bulk_sms(recipient: list, sender_id: str, message: str, schedule: Optional[bool] = False, schedule_time: Optional[str] = None):
     """
     Send bulk SMS to a list of phone numbers.
     
@@ -658,11 +680,11 @@ def send_quick_bulk_sms(recipient: list, sender_id: str, message: str, schedule:
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = sms_endPoint + '/quick/' + '?key=' + apiKey
-    response = requests.post(url, json={"recipient": recipient, "sender": sender_id, "message": message, "is_schedule": schedule, "schedule_date": schedule_time})
-    data = response.json()
+    response = await _http().post(url, json={"recipient": recipient, "sender": sender_id, "message": message, "is_schedule": schedule, "schedule_date": schedule_time})
+    data = _loads(response)
     return data
 
-def send_bulk_group_sms(group_id: list, sender_id: str, message: str, schedule: Optional[bool] = False, schedule_time: Optional[str] = None):
+async def send_bulk_group_sms(group_id: list, sender_id: str, message: str, schedule: Optional[bool] = False, schedule_time: Optional[str] = None):
     """
     Send bulk SMS to contacts in specified groups.
     
@@ -735,15 +757,15 @@ def send_bulk_group_sms(group_id: list, sender_id: str, message: str, schedule:
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = sms_endPoint + '/group/' + '?key=' + apiKey
-    response = requests.post(url, json={"group_id": group_id, "sender": sender_id, "message": message, "is_schedule": schedule, "schedule_date": schedule_time}) #YYYY-MM-DD hh:mm
+    response = await _http().post(url, json={"group_id": group_id, "sender": sender_id, "message": message, "is_schedule": schedule, "schedule_date": schedule_time}) #YYYY-MM-DD hh:mm
     if response.status_code == 200:
-        data = response.json()
+        data = _loads(response)
         return data
     else:
         print(f"Error: {response.status_code}")
         print(f"Response text: {response.text}")
     
-def check_scheduled_sms():
+async def check_scheduled_sms():
     """
     Retrieve the history of all scheduled SMS campaigns.
     
@@ -803,15 +825,15 @@ def check_scheduled_sms():
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = schedule_sms_endPoint + '?key=' + apiKey
-    response = requests.get(url)
+    response = await _http().get(url)
     if response.status_code == 200:
-        data = response.json()
+        data = _loads(response)
         return data
     else:
         print(f"Error: {response.status_code}")
         print(f"Response text: {response.text}")
 
-def update_scheduled_sms(_id: str, sender_id: str, schedule_time: str, message: Optional[str] = None):
+async def update_scheduled_sms(_id: str, sender_id: str, schedule_time: str, message: Optional[str] = None):
     """
     Update a scheduled SMS campaign.
     
@@ -862,11 +884,11 @@ def update_scheduled_sms(_id: str, sender_id: str, schedule_time: str, message:
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = schedule_sms_endPoint + '/' + _id + '?key=' + apiKey
-    response = requests.put(url, json={"sender": sender_id, "schedule_date": schedule_time, "message": message})
-    data = response.json()
+    response = await _http().put(url, json={"sender": sender_id, "schedule_date": schedule_time, "message": message})
+    data = _loads(response)
     return data
 
-def register_sender_id(sender_id: str, purpose: str):
+async def register_sender_id(sender_id: str, purpose: str):
     """
     Register a new sender ID for SMS sending.
     
@@ -899,11 +921,11 @@ def register_sender_id(sender_id: str, purpose: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = sender_id_endpoint + '/register/' + '?key=' + apiKey
-    response = requests.post(url, json={"sender_name": sender_id, "purpose": purpose})
-    data = response.json()
+    response = await _http().post(url, json={"sender_name": sender_id, "purpose": purpose})
+    data = _loads(response)
     return data
 
-def check_sender_id(sender_id: str):
+async def check_sender_id(sender_id: str):
     """
     Check the status of a registered sender ID.
     
@@ -939,11 +961,11 @@ def check_sender_id(sender_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = sender_id_endpoint + '/status/' +  '?key=' + apiKey
-    response = requests.post(url,json={"sender_name": sender_id})
-    data = response.json()
+    response = await _http().post(url,json={"sender_name": sender_id})
+    data = _loads(response)
     return data
 
-def check_sms_balance():
+async def check_sms_balance():
     """
     Check the current SMS balance in your MNotify account.
     
@@ -971,20 +993,20 @@ def check_sms_balance():
     
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, timeout=TIMEOUT)
+            response = await _http().get(url)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response)
             return data
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             if attempt == MAX_RETRIES - 1:
                 return {"error": "SMS balance check timed out. Please check your internet connection."}
-            time.sleep(1)
-        except requests.exceptions.RequestException as e:
+            await asyncio.sleep(1)
+        except httpx.HTTPError as e:
             return {"error": f"SMS balance check failed: {str(e)}"}
         except Exception as e:
             return {"error": f"Unexpected error checking SMS balance: {str(e)}"}
 
-def sms_delivery_report(_id: str):
+async def sms_delivery_report(_id: str):
     """
     Get delivery report for a specific SMS campaign.
     
@@ -1027,11 +1049,11 @@ def sms_delivery_report(_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = base_url + '/campaign/' + _id + '?key=' + apiKey
-    response = requests.get(url)
-    data = response.json()
+    response = await _http().get(url)
+    data = _loads(response)
     return data
 
-def specific_sms_delivery_report(campaign_id: str):
+async def specific_sms_delivery_report(campaign_id: str):
     """
     Get delivery status for a specific SMS message.
     
@@ -1075,11 +1097,11 @@ def specific_sms_delivery_report(campaign_id: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = base_url + '/status/' + campaign_id + '?key=' + apiKey
-    response = requests.get(url)
-    data = response.json()
+    response = await _http().get(url)
+    data = _loads(response)
     return data
 
-def periodic_sms_delivery_report(from_date: str, to_date: str):
+async def periodic_sms_delivery_report(from_date: str, to_date: str):
     """
     Get delivery reports for SMS campaigns within a specific date range.
     
@@ -1115,8 +1137,8 @@ def periodic_sms_delivery_report(from_date: str, to_date: str):
     """
     apiKey = os.getenv("MNOTIFY_API_KEY")
     url = base_url + '/report/' + '?key=' + apiKey  
-    response = requests.get(url, json={"from": from_date, "to": to_date}) #dates are YYYY-MM-DD
-    data = response.json()
+    response = await _http().request("GET", url, json={"from": from_date, "to": to_date}) #dates are YYYY-MM-DD
+    data = _loads(response)
     return data
 
 
@@ -1155,7 +1177,7 @@ def periodic_sms_delivery_report(from_date: str, to_date: str):
     
     return True, None
 
-def safe_api_call(func, *args, **kwargs):
+async def safe_api_call(func, *args, **kwargs):
     """
     Wrapper for API calls with enhanced error handling.
     
@@ -1168,7 +1190,7 @@ def safe_api_call(func, *args, **kwargs):
         dict: Result with success/error status
     """
     try:
-        result = func(*args, **kwargs)
+        result = await func(*args, **kwargs)
         
         # Check if result indicates an error
         if isinstance(result, dict):
@@ -1,10 +1,12 @@
 import os
 import asyncio
+import inspect
 from dotenv import load_dotenv
 from agno.agent import Agent
 from agno.models.openrouter import OpenRouter
 import functions  # Imports the MNotify functions
 from context_cache import EntityCache
+from response_cache import ResponseCache
 from tool_adapter import register_flex_functions
 
 load_dotenv()
@@ -12,11 +14,15 @@ load_dotenv()
 # Initialize the agent with OpenRouter model
 model = OpenRouter(
     api_key=os.getenv("OPENROUTER_API_KEY"),
-    id="openai/gpt-oss-20b" 
+    id="openai/gpt-oss-20b",
+    # Let the model issue all tool calls for a turn at once; the async
+    # wrappers then execute them concurrently.
+    request_params={"parallel_tool_calls": True},
 )
 
 agent = Agent(model=model)
 cache = EntityCache()
+response_cache = ResponseCache()
 
 
 # Add MNotify functions as tools to the agent
@@ -48,6 +54,7 @@ CRITICAL tool usage & error handling
 ID handling & memory
 - Use short “breadcrumbs” from recent tool results (group name → id, campaign id) maintained in a local entity cache
 - If an ID is unknown, fetch list endpoints and continue
+- When several lists are needed at once, prefer one list_resources call (kinds: groups, templates, contacts, scheduled, balance) over separate list calls
 
 Input rules for tools (don’t mention tool names to the user)
 - Strings must be quoted; lists are arrays of strings
@@ -55,6 +62,52 @@ Input rules for tools (don’t mention tool names to the user)
 - Keep user-facing text concise and professional
 """
 
+
+def _tool_schema_summary() -> str:
+    """One-line-per-tool summary of the registered tools."""
+    lines = []
+    for name, wrapper in sorted(registered_flex.items()):
+        doc = (inspect.getdoc(wrapper) or "").strip().splitlines()
+        summary = doc[0].strip() if doc else ""
+        lines.append(f"- {name}: {summary}".rstrip(": "))
+    return "\n".join(lines)
+
+
+# The tool summary never changes within a process, so inlining it keeps the
+# whole blob in the cacheable prefix (and pads it toward the ~2048-token
+# minimum some providers require for implicit prefix caching).
+SYSTEM_PROMPT = SYSTEM_PROMPT + "\nAvailable tools:\n" + _tool_schema_summary() + "\n"
+
+
+def _system_message():
+    """
+    System prompt as a provider cache-marked block (message 0, always), so the
+    backend can reuse the KV cache for this prefix across turns instead of
+    re-prefilling it on every call.
+    """
+    return {
+        "role": "system",
+        "content": [
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+    }
+
+# Max messages kept in the conversation (system prompt included); older
+# turns are evicted so long sessions stay constant-memory and constant-cost.
+HISTORY_CAP = 40
+
+
+def _append(messages, message, cap=HISTORY_CAP):
+    """Append to the conversation, evicting the oldest non-system turns past cap."""
+    messages.append(message)
+    while len(messages) > cap:
+        messages.pop(1)  # keep the system prompt at index 0
+
+
 async def chat_with_agent():
     """Interactive CLI for the MNotify Agent."""
     print("\n📨  MNotify Agent")
@@ -62,12 +115,13 @@ async def chat_with_agent():
     print("  Type 'help' for commands. Type 'quit' to exit.\n")
 
     # Initialize conversation
-    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    messages = [_system_message()]
 
     while True:
         try:
-            # Get user input
-            user_input = input("You: ").strip()
+            # Get user input off-loop: blocking input() would pin the event
+            # loop while the user types, stalling any background work
+            user_input = (await asyncio.to_thread(input, "You: ")).strip()
             
             if user_input.lower() in ['quit', 'exit', 'bye']:
                 print("Goodbye!")
@@ -100,47 +154,77 @@ async def chat_with_agent():
                 
 
             if user_input.lower() == 'clear':
-                messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+                messages = [_system_message()]
+                response_cache.clear()
+                cache.clear()
                 print("Context cleared.\n")
                 continue
             
             if not user_input:
                 continue
 
+            # Serve repeated questions from the response cache (no LLM
+            # round-trip); keyed by session — 'clear' rebinds messages
+            session_key = id(messages)
+            hit, _similarity, cached_response = response_cache.get(user_input, session_key)
+            if hit:
+                _append(messages, {"role": "user", "content": user_input})
+                print(f"Agent: {cached_response}\n")
+                _append(messages, {"role": "assistant", "content": cached_response})
+                continue
+
             # Add user message
-            messages.append({"role": "user", "content": user_input})
+            _append(messages, {"role": "user", "content": user_input})
 
             # Get agent response with streaming
             print("Agent: ", end="", flush=True)
             
       
-            full_response_content = ""
+            content_chunks = []
             tool_calls_made = []
             tool_results = []
             reasoning_steps = []
             tool_errors = []
-            
+
+            def _on_content(event):
+                print(event.content, end="", flush=True)
+                content_chunks.append(event.content)
+
+            def _on_tool_started(event):
+                tool_calls_made.append(event.tool)
+
+            def _on_reasoning(event):
+                reasoning_steps.append(event.content)
+
+            def _on_tool_completed(event):
+                tool_name = getattr(event, 'tool_call', {}).get('name', 'unknown')
+                if hasattr(event, 'tool_call_result') and event.tool_call_result is not None:
+                    tool_results.append({"tool": tool_name, "result": event.tool_call_result})
+                else:
+                    tool_errors.append(tool_name)
+
+            def _on_tool_error(event):
+                tool_name = getattr(event, 'tool_call', {}).get('name', 'unknown')
+                tool_errors.append(tool_name)
+
+            # One dict lookup per event instead of a 5-way if/elif chain
+            dispatch = {
+                "RunResponseContent": _on_content,
+                "ToolCallStarted": _on_tool_started,
+                "ReasoningStep": _on_reasoning,
+                "ToolCallCompleted": _on_tool_completed,
+                "ToolCallError": _on_tool_error,
+            }
+
             try:
-                response_stream = agent.run(messages, stream=True, stream_intermediate_steps=False)
-                
-                for event in response_stream:
-                    if event.event == "RunResponseContent":
-                        print(event.content, end="", flush=True)
-                        full_response_content += event.content
-                    elif event.event == "ToolCallStarted":
-                        tool_calls_made.append(event.tool)
-                    elif event.event == "ReasoningStep":
-                        reasoning_steps.append(event.content)
-                    elif event.event == "ToolCallCompleted":
-                        tool_name = getattr(event, 'tool_call', {}).get('name', 'unknown')
-                        if hasattr(event, 'tool_call_result') and event.tool_call_result is not None:
-                            tool_results.append({"tool": tool_name, "result": event.tool_call_result})
-                        else:
-                            tool_errors.append(tool_name)
-                    elif event.event == "ToolCallError":
-                        tool_name = getattr(event, 'tool_call', {}).get('name', 'unknown')
-                        tool_errors.append(tool_name)
-                        error_msg = getattr(event, 'error', 'Unknown error')
+                response_stream = await agent.arun(messages, stream=True, stream_intermediate_steps=False)
+
+                async for event in response_stream:
+                    handler = dispatch.get(event.event)
+                    if handler is not None:
+                        handler(event)
+                full_response_content = "".join(content_chunks)
+
                 # Index all tool results into cache
                 for tr in tool_results:
                     tname = tr.get("tool", "")
@@ -153,22 +237,26 @@ async def chat_with_agent():
                 # Optionally add tiny breadcrumbs from cache for continuity
                 memory_lines = cache.get_memory_lines_and_reset()
                 if memory_lines:
-                    messages.append({"role": "assistant", "content": "\n".join(memory_lines)})
+                    _append(messages, {"role": "assistant", "content": "\n".join(memory_lines)})
 
                 # Add the agent response to conversation history
                 if full_response_content.strip():
-                    messages.append({"role": "assistant", "content": full_response_content})
+                    _append(messages, {"role": "assistant", "content": full_response_content})
                 elif tool_calls_made:
-                    messages.append({"role": "assistant", "content": "I attempted to process your request but I didn't get a response. Please let me know and I can try a different approach or provide more details about what happened."})
+                    _append(messages, {"role": "assistant", "content": "I attempted to process your request but I didn't get a response. Please let me know and I can try a different approach or provide more details about what happened."})
                 else:
-                    messages.append({"role": "assistant", "content": "I'm not sure how to help with that request."})
+                    _append(messages, {"role": "assistant", "content": "I'm not sure how to help with that request."})
+
+                # Cache pure Q&A turns; tool-calling turns would go stale
+                if full_response_content.strip() and not tool_calls_made and not tool_errors:
+                    response_cache.set(user_input, full_response_content, session_key)
 
                 print("\n")
                 
             except Exception as e:
                 error_msg = f"Streaming error: {e}"
                 print(f"\n❌ {error_msg}")
-                messages.append({"role": "assistant", "content": f"Sorry, I encountered an error: {e}"})
+                _append(messages, {"role": "assistant", "content": f"Sorry, I encountered an error: {e}"})
                 print()
 
         except KeyboardInterrupt:
@@ -31,11 +31,11 @@ def _coerce_str_list(value: Any) -> List[str]:
     return [p.strip().strip("\"'") for p in raw.split(",") if p.strip()]
 
 
-def _maybe_verify_sender(sender_id: str, verify_flag: bool) -> None:
+async def _maybe_verify_sender(sender_id: str, verify_flag: bool) -> None:
     if not verify_flag:
         return
     try:
-        status = mnotify.check_sender_id(sender_id=sender_id)
+        status = await mnotify.check_sender_id(sender_id=sender_id)
         state = str((status or {}).get("status") or (status or {}).get("state") or "").lower()
         if state and state not in {"approved", "active", "ok", "success"}:
             pass
@@ -44,7 +44,7 @@ def _maybe_verify_sender(sender_id: str, verify_flag: bool) -> None:
 
 
 @server.tool("send_quick_bulk_sms")
-def send_quick_bulk_sms(
+async def send_quick_bulk_sms(
     recipient: Union[str, List[str], None] = None,
     recipients: Union[str, List[str], None] = None,
     sender_id: str = "",
@@ -74,8 +74,8 @@ def send_quick_bulk_sms(
         return {"error": "schedule_time is required when schedule is true (YYYY-MM-DD HH:MM)"}
     if len(message) > 460:
         return {"error": f"message is too long ({len(message)} chars). Max 460."}
-    _maybe_verify_sender(sender_id, bool(verify_sender))
-    result = mnotify.send_quick_bulk_sms(
+    await _maybe_verify_sender(sender_id, bool(verify_sender))
+    result = await mnotify.send_quick_bulk_sms(
         recipient=recipients_list,
         sender_id=sender_id,
         message=message,
@@ -90,7 +90,7 @@ def send_quick_bulk_sms(
 
 
 @server.tool("send_bulk_group_sms")
-def send_bulk_group_sms(
+async def send_bulk_group_sms(
     group_id: Union[str, List[str], None] = None,
     groups: Union[str, List[str], None] = None,
     group_names: Union[str, List[str], None] = None,
@@ -122,7 +122,7 @@ def send_bulk_group_sms(
         # If still empty, try to fetch groups now and retry resolution
         if not group_ids:
             try:
-                result_list = mnotify.get_group_list()
+                result_list = await mnotify.get_group_list()
                 try:
                     cache.index_tool_result("get_group_list", result_list)
                 except Exception:
@@ -142,8 +142,8 @@ def send_bulk_group_sms(
         return {"error": "schedule_time is required when schedule is true (YYYY-MM-DD HH:MM)"}
     if len(message) > 460:
         return {"error": f"message is too long ({len(message)} chars). Max 460."}
-    _maybe_verify_sender(sender_id, bool(verify_sender))
-    result = mnotify.send_bulk_group_sms(
+    await _maybe_verify_sender(sender_id, bool(verify_sender))
+    result = await mnotify.send_bulk_group_sms(
         group_id=group_ids,
         sender_id=sender_id,
         message=message,
@@ -159,7 +159,7 @@ def send_bulk_group_sms(
 
 
 @server.tool("update_scheduled_sms")
-def update_scheduled_sms(
+async def update_scheduled_sms(
     id: str,
     sender_id: str,
     schedule_time: str,
@@ -170,7 +170,7 @@ def update_scheduled_sms(
     Supply `id`, `sender_id`, `schedule_time`, and optional `message` (≤ 460 chars).
     """
     _require_key()
-    result = mnotify.update_scheduled_sms(
+    result = await mnotify.update_scheduled_sms(
         _id=id,
         sender_id=sender_id,
         schedule_time=schedule_time,
@@ -184,10 +184,10 @@ def update_scheduled_sms(
 
 
 @server.tool("sms_delivery_report")
-def sms_delivery_report(id: str) -> Dict[str, Any]:
+async def sms_delivery_report(id: str) -> Dict[str, Any]:
     """Get the delivery report for a specific SMS campaign by its ID."""
     _require_key()
-    result = mnotify.sms_delivery_report(_id=id) 
+    result = await mnotify.sms_delivery_report(_id=id) 
     try:
         cache.index_tool_result("sms_delivery_report", result)
     except Exception:
@@ -196,10 +196,10 @@ def sms_delivery_report(id: str) -> Dict[str, Any]:
 
 
 @server.tool("specific_sms_delivery_report")
-def specific_sms_delivery_report(campaign_id: str) -> Dict[str, Any]:
+async def specific_sms_delivery_report(campaign_id: str) -> Dict[str, Any]:
     """Get the delivery status for a specific message within a campaign by `campaign_id`."""
     _require_key()
-    result = mnotify.specific_sms_delivery_report(campaign_id=campaign_id) 
+    result = await mnotify.specific_sms_delivery_report(campaign_id=campaign_id) 
     try:
         cache.index_tool_result("specific_sms_delivery_report", result)
     except Exception:
@@ -208,10 +208,10 @@ def specific_sms_delivery_report(campaign_id: str) -> Dict[str, Any]:
 
 
 @server.tool("periodic_sms_delivery_report")
-def periodic_sms_delivery_report(from_date: str, to_date: str) -> Dict[str, Any]:
+async def periodic_sms_delivery_report(from_date: str, to_date: str) -> Dict[str, Any]:
     """Get delivery reports for campaigns within a date range (YYYY-MM-DD)."""
     _require_key()
-    result = mnotify.periodic_sms_delivery_report(from_date=from_date, to_date=to_date) 
+    result = await mnotify.periodic_sms_delivery_report(from_date=from_date, to_date=to_date) 
     try:
         cache.index_tool_result("periodic_sms_delivery_report", result)
     except Exception:
@@ -221,7 +221,7 @@ def periodic_sms_delivery_report(from_date: str, to_date: str) -> Dict[str, Any]
 
 # Contacts
 @server.tool("add_contact")
-def add_contact(
+async def add_contact(
     group_id: str,
     phone: str,
     first_name: Optional[str] = None,
@@ -231,7 +231,7 @@ def add_contact(
 ) -> Dict[str, Any]:
     """Add a contact to a group. Requires `group_id` and `phone`."""
     _require_key()
-    result = mnotify.add_contact(
+    result = await mnotify.add_contact(
         group_id=group_id,
         phone=phone,
         first_name=first_name,
@@ -247,7 +247,7 @@ def add_contact(
 
 
 @server.tool("update_contact")
-def update_contact(
+async def update_contact(
     contact_id: str,
     phone: str,
     first_name: Optional[str] = None,
@@ -258,7 +258,7 @@ def update_contact(
 ) -> Dict[str, Any]:
     """Update a contact by `contact_id`. Requires `phone`; other fields optional."""
     _require_key()
-    result = mnotify.update_contact(
+    result = await mnotify.update_contact(
         contact_id=contact_id,
         phone=phone,
         first_name=first_name,
@@ -275,17 +275,17 @@ def update_contact(
 
 
 @server.tool("delete_contact")
-def delete_contact(contact_id: str) -> Dict[str, Any]:
+async def delete_contact(contact_id: str) -> Dict[str, Any]:
     """Delete a contact by `contact_id`."""
     _require_key()
-    return mnotify.delete_contact(contact_id=contact_id) 
+    return await mnotify.delete_contact(contact_id=contact_id) 
 
 
 @server.tool("get_contact_details")
-def get_contact_details(contact_id: str) -> Dict[str, Any]:
+async def get_contact_details(contact_id: str) -> Dict[str, Any]:
     """Fetch contact details by `contact_id`."""
     _require_key()
-    result = mnotify.get_contact_details(contact_id=contact_id) 
+    result = await mnotify.get_contact_details(contact_id=contact_id) 
     try:
         cache.index_tool_result("get_contact_details", result)
     except Exception:
@@ -294,10 +294,10 @@ def get_contact_details(contact_id: str) -> Dict[str, Any]:
 
 
 @server.tool("get_contact_list")
-def get_contact_list() -> Dict[str, Any]:
+async def get_contact_list() -> Dict[str, Any]:
     """List contacts (first page as returned by the API)."""
     _require_key()
-    result = mnotify.get_contact_list() 
+    result = await mnotify.get_contact_list() 
     try:
         cache.index_tool_result("get_contact_list", result)
     except Exception:
@@ -306,10 +306,10 @@ def get_contact_list() -> Dict[str, Any]:
 
 
 @server.tool("get_group_contacts")
-def get_group_contacts(group_id: str) -> Dict[str, Any]:
+async def get_group_contacts(group_id: str) -> Dict[str, Any]:
     """List contacts in a given group by `group_id`."""
     _require_key()
-    result = mnotify.get_group_contacts(group_id=group_id) 
+    result = await mnotify.get_group_contacts(group_id=group_id) 
     try:
         cache.index_tool_result("get_group_contacts", result)
     except Exception:
@@ -319,10 +319,10 @@ def get_group_contacts(group_id: str) -> Dict[str, Any]:
 
 # Groups
 @server.tool("add_group")
-def add_group(group_name: str) -> Dict[str, Any]:
+async def add_group(group_name: str) -> Dict[str, Any]:
     """Create a new contact group with `group_name`."""
     _require_key()
-    result = mnotify.add_group(group_name=group_name) 
+    result = await mnotify.add_group(group_name=group_name) 
     try:
         cache.index_tool_result("add_group", result)
     except Exception:
@@ -331,10 +331,10 @@ def add_group(group_name: str) -> Dict[str, Any]:
 
 
 @server.tool("update_group")
-def update_group(group_id: str, group_name: str) -> Dict[str, Any]:
+async def update_group(group_id: str, group_name: str) -> Dict[str, Any]:
     """Rename a contact group by `group_id` to `group_name`."""
     _require_key()
-    result = mnotify.update_group(group_id=group_id, group_name=group_name) 
+    result = await mnotify.update_group(group_id=group_id, group_name=group_name) 
     try:
         cache.index_tool_result("update_group", result)
     except Exception:
@@ -343,10 +343,10 @@ def update_group(group_id: str, group_name: str) -> Dict[str, Any]:
 
 
 @server.tool("delete_group")
-def delete_group(group_id: str) -> Dict[str, Any]:
+async def delete_group(group_id: str) -> Dict[str, Any]:
     """Delete a contact group by `group_id`."""
     _require_key()
-    result = mnotify.delete_group(group_id=group_id) 
+    result = await mnotify.delete_group(group_id=group_id) 
     try:
         cache.index_tool_result("delete_group", result)
     except Exception:
@@ -355,10 +355,10 @@ def delete_group(group_id: str) -> Dict[str, Any]:
 
 
 @server.tool("get_group_details")
-def get_group_details(group_id: str) -> Dict[str, Any]:
+async def get_group_details(group_id: str) -> Dict[str, Any]:
     """Fetch details for a group by `group_id`."""
     _require_key()
-    result = mnotify.get_group_details(group_id=group_id) 
+    result = await mnotify.get_group_details(group_id=group_id) 
     try:
         cache.index_tool_result("get_group_details", result)
     except Exception:
@@ -367,10 +367,10 @@ def get_group_details(group_id: str) -> Dict[str, Any]:
 
 
 @server.tool("get_group_list")
-def get_group_list_tool() -> Dict[str, Any]:
+async def get_group_list_tool() -> Dict[str, Any]:
     """List all groups."""
     _require_key()
-    result = mnotify.get_group_list() 
+    result = await mnotify.get_group_list() 
     try:
         cache.index_tool_result("get_group_list", result)
     except Exception:
@@ -380,10 +380,10 @@ def get_group_list_tool() -> Dict[str, Any]:
 
 # Templates
 @server.tool("get_template_list")
-def get_template_list_tool() -> Dict[str, Any]:
+async def get_template_list_tool() -> Dict[str, Any]:
     """List message templates."""
     _require_key()
-    result = mnotify.get_template_list() 
+    result = await mnotify.get_template_list() 
     try:
         cache.index_tool_result("get_template_list", result)
     except Exception:
@@ -392,10 +392,10 @@ def get_template_list_tool() -> Dict[str, Any]:
 
 
 @server.tool("get_message_template")
-def get_message_template(template_id: str) -> Dict[str, Any]:
+async def get_message_template(template_id: str) -> Dict[str, Any]:
     """Fetch a message template by `template_id`."""
     _require_key()
-    result = mnotify.get_message_template(template_id=template_id) 
+    result = await mnotify.get_message_template(template_id=template_id) 
     try:
         cache.index_tool_result("get_message_template", result)
     except Exception:
@@ -404,10 +404,10 @@ def get_message_template(template_id: str) -> Dict[str, Any]:
 
 
 @server.tool("add_message_template")
-def add_message_template(title: str, content: str) -> Dict[str, Any]:
+async def add_message_template(title: str, content: str) -> Dict[str, Any]:
     """Create a message template with `title` and `content`."""
     _require_key()
-    result = mnotify.add_message_template(title=title, content=content) 
+    result = await mnotify.add_message_template(title=title, content=content) 
     try:
         cache.index_tool_result("add_message_template", result)
     except Exception:
@@ -416,10 +416,10 @@ def add_message_template(title: str, content: str) -> Dict[str, Any]:
 
 
 @server.tool("update_message_template")
-def update_message_template(template_id: str, title: Optional[str] = None, content: Optional[str] = None) -> Dict[str, Any]:
+async def update_message_template(template_id: str, title: Optional[str] = None, content: Optional[str] = None) -> Dict[str, Any]:
     """Update a template by `template_id`. `title` and/or `content` optional."""
     _require_key()
-    result = mnotify.update_message_template(template_id=template_id, title=title, content=content) 
+    result = await mnotify.update_message_template(template_id=template_id, title=title, content=content) 
     try:
         cache.index_tool_result("update_message_template", result)
     except Exception:
@@ -428,10 +428,10 @@ def update_message_template(template_id: str, title: Optional[str] = None, conte
 
 
 @server.tool("delete_message_template")
-def delete_message_template(template_id: str) -> Dict[str, Any]:
+async def delete_message_template(template_id: str) -> Dict[str, Any]:
     """Delete a message template by `template_id`."""
     _require_key()
-    result = mnotify.delete_message_template(template_id=template_id) 
+    result = await mnotify.delete_message_template(template_id=template_id) 
     try:
         cache.index_tool_result("delete_message_template", result)
     except Exception:
@@ -441,10 +441,10 @@ def delete_message_template(template_id: str) -> Dict[str, Any]:
 
 # Utilities
 @server.tool("register_sender_id")
-def register_sender_id(sender_id: str, purpose: str) -> Dict[str, Any]:
+async def register_sender_id(sender_id: str, purpose: str) -> Dict[str, Any]:
     """Register a sender ID (≤ 11 chars) with a `purpose`."""
     _require_key()
-    result = mnotify.register_sender_id(sender_id=sender_id, purpose=purpose) 
+    result = await mnotify.register_sender_id(sender_id=sender_id, purpose=purpose) 
     try:
         cache.index_tool_result("register_sender_id", result)
     except Exception:
@@ -453,10 +453,10 @@ def register_sender_id(sender_id: str, purpose: str) -> Dict[str, Any]:
 
 
 @server.tool("check_sender_id")
-def check_sender_id(sender_id: str) -> Dict[str, Any]:
+async def check_sender_id(sender_id: str) -> Dict[str, Any]:
     """Check the status of a registered sender ID."""
     _require_key()
-    result = mnotify.check_sender_id(sender_id=sender_id) 
+    result = await mnotify.check_sender_id(sender_id=sender_id) 
     try:
         cache.index_tool_result("check_sender_id", result)
     except Exception:
@@ -465,15 +465,15 @@ def check_sender_id(sender_id: str) -> Dict[str, Any]:
 
 
 @server.tool("check_sms_balance")
-def check_sms_balance_tool() -> Dict[str, Any]:
+async def check_sms_balance_tool() -> Dict[str, Any]:
     """Get your current SMS balance and wallet summary."""
     _require_key()
-    return mnotify.check_sms_balance() 
+    return await mnotify.check_sms_balance() 
 
 
 # Helper/context tools: expose a small snapshot of known IDs
 @server.tool("get_context_snapshot")
-def get_context_snapshot() -> Dict[str, Any]:
+async def get_context_snapshot() -> Dict[str, Any]:
     """Return a compact snapshot of known entities (names → IDs) gathered so far."""
     lines = []
     try:
@@ -484,7 +484,7 @@ def get_context_snapshot() -> Dict[str, Any]:
 
 
 @server.tool("resolve_group_name")
-def resolve_group_name(group_name: str, fetch: bool = False) -> Dict[str, Any]:
+async def resolve_group_name(group_name: str, fetch: bool = False) -> Dict[str, Any]:
     """Resolve a group name (case-insensitive, substring) to known IDs from this session.
 
     This uses the MCP server's in-memory cache populated by prior tool calls.
@@ -502,7 +502,7 @@ def resolve_group_name(group_name: str, fetch: bool = False) -> Dict[str, Any]:
         pass
     if not matches and bool(fetch):
         try:
-            result_list = mnotify.get_group_list()
+            result_list = await mnotify.get_group_list()
             try:
                 cache.index_tool_result("get_group_list", result_list)
             except Exception:
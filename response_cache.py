@@ -0,0 +1,86 @@
+import time
+from difflib import SequenceMatcher
+from typing import List, Optional, Tuple
+
+
+# Words that signal the user wants a real action (tool call), not a cached answer.
+_MUTATION_KEYWORDS = {
+    "send", "delete", "update", "add", "schedule",
+    "create", "remove", "register", "resend",
+}
+
+
+def _normalize(text: Optional[str]) -> str:
+    if not isinstance(text, str):
+        return ""
+    return " ".join(text.strip().lower().split())
+
+
+def has_mutation_intent(text: str) -> bool:
+    """True when the query contains an action keyword (send/delete/update/...)."""
+    return bool(set(_normalize(text).split()) & _MUTATION_KEYWORDS)
+
+
+class ResponseCache:
+    """
+    In-memory response cache for pure Q&A turns in the CLI loop.
+
+    Entries are keyed by a stable per-session id (the CLI uses id(messages),
+    which changes when the context is cleared), so a repeated question hits
+    on its first repeat regardless of what the model answered in between.
+    Matching is by normalized text with a difflib fuzzy fallback: exact
+    re-asks and near-duplicates ("what's my SMS balance" vs "whats my sms
+    balance") hit; true paraphrases would need an embedding backend and are
+    deliberately out of scope — the 0.85 ratio threshold keeps fuzzy matches
+    to typo/punctuation variants only.
+
+    Only pure question/answer turns are cached: callers must skip set() for
+    any turn that made tool calls, and get() refuses queries with mutation
+    keywords, so stale SMS/balance results are never served.
+    """
+
+    def __init__(self, threshold: float = 0.85, max_entries: int = 128) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # (session_id, normalized_query, response, timestamp)
+        self._entries: List[Tuple[int, str, str, float]] = []
+
+    def get(self, query: str, session_id: int) -> Tuple[bool, float, Optional[str]]:
+        """
+        Look up a cached response for `query` in the given session.
+
+        Returns (hit, similarity, response). Never hits for queries with
+        mutation intent, so real actions always reach the agent.
+        """
+        norm = _normalize(query)
+        if not norm or has_mutation_intent(query):
+            return False, 0.0, None
+
+        best_sim = 0.0
+        best_response: Optional[str] = None
+        for sid, cached_query, response, _ts in self._entries:
+            if sid != session_id:
+                continue
+            if cached_query == norm:
+                return True, 1.0, response
+            sim = SequenceMatcher(None, cached_query, norm).ratio()
+            if sim > best_sim:
+                best_sim = sim
+                best_response = response
+
+        if best_response is not None and best_sim >= self.threshold:
+            return True, best_sim, best_response
+        return False, best_sim, None
+
+    def set(self, query: str, response: str, session_id: int) -> None:
+        """Cache a response for a pure Q&A turn (no tool calls, no errors)."""
+        norm = _normalize(query)
+        if not norm or not response or has_mutation_intent(query):
+            return
+        self._entries.append((session_id, norm, response, time.time()))
+        if len(self._entries) > self.max_entries:
+            # Drop oldest entries first
+            self._entries = self._entries[-self.max_entries:]
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,6 +1,16 @@
+import asyncio
+import functools
 import inspect
+import re
 from typing import Any, Callable, Dict, List, Optional, get_origin, get_args
 
+# One token per comma-separated element; brackets, surrounding quotes and
+# whitespace are excluded by the pattern itself, so parsing is a single
+# C-level findall pass instead of split + repeated strips.
+_CSV_TOKEN = re.compile(r"[^,\[\]'\"\s][^,\[\]]*[^,\[\]'\"\s]|[^,\[\]'\"\s]")
+
+_STRIP_CHARS = " \t\r\n'\""
+
 def _to_str(value: Any) -> str:
     return "" if value is None else str(value)
 
@@ -37,12 +47,39 @@ def _to_str_list(value: Any) -> List[str]:
     if value is None:
         return []
     if isinstance(value, list):
-        return [str(x).strip().strip("\"'") for x in value if str(x).strip()]
-    raw = str(value).strip()
-    if raw.startswith("[") and raw.endswith("]"):
-        raw = raw[1:-1]
-    parts = [p.strip() for p in raw.split(",")]
-    return [p.strip().strip("\"'") for p in parts if p.strip()]
+        # Fast path for the common JSON-decoded case: one str() and one
+        # strip per element instead of two of each.
+        out: List[str] = []
+        for x in value:
+            s = x if type(x) is str else str(x)
+            s = s.strip(_STRIP_CHARS)
+            if s:
+                out.append(s)
+        return out
+    return _CSV_TOKEN.findall(str(value))
+
+
+_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "str": _to_str,
+    "bool": _to_bool,
+    "int": _to_int,
+    "float": _to_float,
+    "list": _to_str_list,
+    "list[str]": _to_str_list,
+}
+
+_MISSING = object()
+
+# Common param-name variants seen in model tool calls, applied to every tool.
+_GLOBAL_ALIASES: Dict[str, str] = {
+    "phoneNumber": "phone",
+    "phone_number": "phone",
+    "groupId": "group_id",
+    "group": "group_id",
+    "contactId": "contact_id",
+    "templateId": "template_id",
+    "campaignId": "campaign_id",
+}
 
 
 # Adapter config types
@@ -56,6 +93,7 @@ class FunctionOverride:
         defaults: Optional[Dict[str, Any]] = None,
         aliases: Optional[Dict[str, str]] = None,
         max_lengths: Optional[Dict[str, int]] = None,
+        wraps_kwargs: bool = False,
     ) -> None:
         self.expected_types = expected_types or {}
         self.required = set(required or [])
@@ -64,15 +102,19 @@ class FunctionOverride:
         self.defaults = defaults or {}
         self.aliases = aliases or {}
         self.max_lengths = max_lengths or {}
+        # Set when the caller delivers arguments as a single {"kwargs": {...}}
+        # blob; the unwrap branch is only generated for those overrides.
+        self.wraps_kwargs = wraps_kwargs
 
 
-def _infer_expected_type(param: inspect.Parameter) -> str:
-    """
-    Infer a simple expected type string from annotations when possible.
-    Supported: str, bool, int, float, list[str] (as 'list[str]' or 'list')
-    Default fallback: 'str'
-    """
-    annotation = param.annotation
+@functools.lru_cache(maxsize=None)
+def _sig(func: Callable) -> inspect.Signature:
+    """Memoized inspect.signature — the walk is expensive and pure."""
+    return inspect.signature(func)
+
+
+@functools.lru_cache(maxsize=None)
+def _infer_from_annotation(annotation: Any) -> str:
     if annotation is inspect._empty:
         return "str"
     origin = get_origin(annotation)
@@ -91,137 +133,155 @@ def _infer_expected_type(param: inspect.Parameter) -> str:
     return "str"
 
 
-def _coerce_value(expected: str, value: Any) -> Any:
-    if expected == "str":
-        return _to_str(value)
-    if expected == "bool":
-        return _to_bool(value)
-    if expected == "int":
-        return _to_int(value)
-    if expected == "float":
-        return _to_float(value)
-    if expected in ("list", "list[str]"):
-        return _to_str_list(value)
-    return value
+def _infer_expected_type(param: inspect.Parameter) -> str:
+    """
+    Infer a simple expected type string from annotations when possible.
+    Supported: str, bool, int, float, list[str] (as 'list[str]' or 'list')
+    Default fallback: 'str'
+    """
+    try:
+        return _infer_from_annotation(param.annotation)
+    except TypeError:
+        # Unhashable annotation; fall back to the uncached path
+        return _infer_from_annotation.__wrapped__(param.annotation)
+
+
+def _expand_full_name(kwargs: Dict[str, Any]) -> None:
+    """Expand 'name'/'full_name' into first_name/last_name if missing."""
+    if "full_name" in kwargs or "name" in kwargs:
+        full_name_value = kwargs.pop("full_name", None) or kwargs.pop("name", None)
+        if full_name_value and ("first_name" not in kwargs and "last_name" not in kwargs):
+            text = str(full_name_value).strip()
+            parts = [p for p in text.split() if p]
+            if len(parts) == 1:
+                kwargs["first_name"] = parts[0]
+            elif len(parts) >= 2:
+                kwargs["first_name"] = " ".join(parts[:-1])
+                kwargs["last_name"] = parts[-1]
+
+
+def _contacts_to_phone(kwargs: Dict[str, Any]) -> None:
+    """Map a 'contacts' list → first phone when single-add APIs are used."""
+    if "contacts" in kwargs and "phone" not in kwargs:
+        contacts_value = kwargs.pop("contacts")
+        if isinstance(contacts_value, list) and contacts_value:
+            for item in contacts_value:
+                s = str(item).strip()
+                if s:
+                    kwargs["phone"] = s
+                    break
 
 
-def make_flex_wrapper(func: Callable, override: Optional[FunctionOverride] = None) -> Callable:
-    sig = inspect.signature(func)
+def make_flex_wrapper(
+    func: Callable,
+    override: Optional[FunctionOverride] = None,
+    extra_aliases: Optional[Dict[str, str]] = None,
+) -> Callable:
+    sig = _sig(func)
     override = override or FunctionOverride()
 
-    def wrapper(**kwargs):
-        if (
-            isinstance(kwargs, dict)
-            and len(kwargs) == 1
-            and "kwargs" in kwargs
-            and isinstance(kwargs.get("kwargs"), dict)
-        ):
-            kwargs = kwargs["kwargs"]
-
-        # Pre-alias normalization for common variants
-        try:
-            normalized: Dict[str, Any] = {}
-            for key, value in list(kwargs.items()):
-                canonical = key
-                if key in {"phoneNumber", "phone_number"}:
-                    canonical = "phone"
-                elif key in {"groupId", "group"}:
-                    canonical = "group_id"
-                elif key in {"contactId"}:
-                    canonical = "contact_id"
-                elif key in {"templateId"}:
-                    canonical = "template_id"
-                elif key in {"campaignId"}:
-                    canonical = "campaign_id"
-                if canonical not in kwargs:
-                    normalized[canonical] = value
-            kwargs.update(normalized)
-
-            # Expand 'name'/'full_name' into first_name/last_name if missing
-            full_name_value = None
-            if "full_name" in kwargs:
-                full_name_value = kwargs.get("full_name")
-            elif "name" in kwargs:
-                full_name_value = kwargs.get("name")
-            if full_name_value and ("first_name" not in kwargs and "last_name" not in kwargs):
-                text = str(full_name_value).strip()
-                parts = [p for p in text.split() if p]
-                if len(parts) == 1:
-                    kwargs["first_name"] = parts[0]
-                elif len(parts) >= 2:
-                    kwargs["first_name"] = " ".join(parts[:-1])
-                    kwargs["last_name"] = parts[-1]
-
-            # Map 'contacts' list → first phone when single-add APIs are used
-            if "contacts" in kwargs and "phone" not in kwargs:
-                contacts_value = kwargs.get("contacts")
-                if isinstance(contacts_value, list) and contacts_value:
-                    for item in contacts_value:
-                        s = str(item).strip()
-                        if s:
-                            kwargs["phone"] = s
-                            break
-        except Exception:
-            pass
-        # Apply aliases first
-        if override.aliases:
-            for alias, canonical in override.aliases.items():
-                if alias in kwargs and canonical not in kwargs:
-                    kwargs[canonical] = kwargs.pop(alias)
-
-        bound_args = {}
-        # Apply defaults from override first
-        for k, v in override.defaults.items():
-            bound_args[k] = v
-
-        # Coerce and bind known params
-        for name, param in sig.parameters.items():
-            if name in kwargs:
-                expected = override.expected_types.get(name) or _infer_expected_type(param)
-                bound_args[name] = _coerce_value(expected, kwargs[name])
-            else:
-                if param.default is not inspect._empty:
-                    # Has a default in original function; keep unspecified
-                    pass
-                else:
-                    pass
-
-        for k, v in kwargs.items():
-            if k not in bound_args:
-                bound_args[k] = v
-
-        # Validate required parameters
-        missing: List[str] = []
-        for req in override.required:
-            if bound_args.get(req) in (None, "", [], {}):
-                missing.append(req)
-
-        # Conditional requirements (e.g., schedule_time when schedule is True)
-        for rule in override.required_if:
-            param_name = rule.get("param")
-            when = rule.get("when", {})
-            meets = True
-            for wkey, wval in when.items():
-                if bound_args.get(wkey) != wval:
-                    meets = False
-                    break
-            if meets and bound_args.get(param_name) in (None, "", [], {}):
-                missing.append(param_name)
-
-        if missing:
-            return {"error": f"Missing required parameter(s): {', '.join(sorted(set(missing)))}"}
-
-        for field_name, max_len in (override.max_lengths or {}).items():
-            value = bound_args.get(field_name)
-            if isinstance(value, str) and len(value) > int(max_len):
-                return {
-                    "error": (
-                        f"{field_name} is too long ({len(value)} characters). "
-                        f"Maximum allowed is {max_len}. Please shorten it and try again."
-                    )
-                }
+    # Precompute the per-parameter coercion plan and validation tables once at
+    # registration, so the wrapper body is straight-line dict lookups instead
+    # of re-walking the signature and override on every tool call. The plan is
+    # laid out as parallel tuples (structure-of-arrays) so the hot loop is
+    # plain index arithmetic over flat sequences of primitives.
+    param_names: List[str] = []
+    param_coercers: List[Callable[[Any], Any]] = []
+    for name, param in sig.parameters.items():
+        param_names.append(name)
+        param_coercers.append(
+            _COERCERS.get(override.expected_types.get(name) or _infer_expected_type(param), _to_str)
+        )
+    param_names = tuple(param_names)
+    param_coercers = tuple(param_coercers)
+    # Merged into a local so the shared (cached) override is never mutated
+    combined_aliases = {**_GLOBAL_ALIASES, **(extra_aliases or {}), **override.aliases}
+    is_async = inspect.iscoroutinefunction(func)
+    default_items = tuple(override.defaults.items())
+    required_tuple = tuple(override.required)
+    required_if_rules = tuple(
+        (rule.get("param"), tuple(rule.get("when", {}).items()))
+        for rule in override.required_if
+    )
+    max_length_items = tuple((name, int(limit)) for name, limit in override.max_lengths.items())
+
+    # Generate a specialized wrapper body for this function: the parameter
+    # loop, coercer dispatch, and validation rules are unrolled into
+    # straight-line code, and blocks the override doesn't use are simply not
+    # emitted. exec-ing the source gives dispatch with no per-call branching
+    # on override flags.
+    param_set = set(param_names)
+    ns: Dict[str, Any] = {
+        "_fn": func,
+        "_MISSING": _MISSING,
+        "_DEFAULTS": dict(default_items),
+        "_to_thread": asyncio.to_thread,
+        "_expand_full_name": _expand_full_name,
+        "_contacts_to_phone": _contacts_to_phone,
+    }
 
-        return func(**bound_args)
+    lines = ["async def wrapper(**kwargs):"]
+    if override.wraps_kwargs:
+        lines.append("    if len(kwargs) == 1 and 'kwargs' in kwargs and isinstance(kwargs.get('kwargs'), dict):")
+        lines.append("        kwargs = kwargs['kwargs']")
+    for alias, canonical in combined_aliases.items():
+        if canonical not in param_set:
+            continue
+        lines.append(f"    if {alias!r} in kwargs and {canonical!r} not in kwargs:")
+        lines.append(f"        kwargs[{canonical!r}] = kwargs.pop({alias!r})")
+    if "first_name" in param_set or "last_name" in param_set:
+        lines.append("    _expand_full_name(kwargs)")
+    if "phone" in param_set:
+        lines.append("    _contacts_to_phone(kwargs)")
+
+    lines.append("    bound_args = dict(_DEFAULTS)" if default_items else "    bound_args = {}")
+    for i, name in enumerate(param_names):
+        ns[f"_c{i}"] = param_coercers[i]
+        lines.append(f"    v = kwargs.get({name!r}, _MISSING)")
+        lines.append("    if v is not _MISSING:")
+        lines.append(f"        bound_args[{name!r}] = _c{i}(v)")
+
+    lines.append("    for k, v in kwargs.items():")
+    lines.append("        if k not in bound_args:")
+    lines.append("            bound_args[k] = v")
+
+    # Required and conditional requirements are one fused pass. The falsy
+    # test stands in for (None, '', [], {}) — these params are never
+    # legitimately 0/False, so truthiness is equivalent and much cheaper.
+    if required_tuple or required_if_rules:
+        lines.append("    missing = []")
+        for req in required_tuple:
+            lines.append(f"    if not bound_args.get({req!r}):")
+            lines.append(f"        missing.append({req!r})")
+        for param_name, when in required_if_rules:
+            conds = [f"bound_args.get({wkey!r}) == {wval!r}" for wkey, wval in when]
+            conds.append(f"not bound_args.get({param_name!r})")
+            lines.append(f"    if {' and '.join(conds)}:")
+            lines.append(f"        missing.append({param_name!r})")
+        lines.append("    if missing:")
+        lines.append(
+            "        return {'error': 'Missing required parameter(s): ' + ', '.join(sorted(set(missing)))}"
+        )
+
+    for field_name, max_len in max_length_items:
+        lines.append(f"    v = bound_args.get({field_name!r})")
+        lines.append(f"    if isinstance(v, str) and len(v) > {max_len}:")
+        lines.append(
+            f"        return {{'error': f'{field_name} is too long ({{len(v)}} characters). "
+            f"Maximum allowed is {max_len}. Please shorten it and try again.'}}"
+        )
+
+    # Async tool functions run natively on the event loop; blocking ones
+    # are pushed to a thread so concurrent tool calls can still overlap.
+    if is_async:
+        lines.append("    return await _fn(**bound_args)")
+    else:
+        lines.append("    return await _to_thread(_fn, **bound_args)")
+
+    source = "\n".join(lines)
+    code = compile(source, f"<flex:{func.__name__}>", "exec")
+    exec(code, ns)
+    wrapper = ns["wrapper"]
 
     try:
         wrapper.__name__ = func.__name__
@@ -237,8 +297,64 @@ def make_flex_wrapper(func: Callable, override: Optional[FunctionOverride] = Non
     return wrapper
 
 
+# List-style fetchers exposed through the list_resources aggregator
+_LIST_RESOURCE_FUNCS: Dict[str, str] = {
+    "groups": "get_group_list",
+    "templates": "get_template_list",
+    "contacts": "get_contact_list",
+    "scheduled": "check_scheduled_sms",
+    "balance": "check_sms_balance",
+}
+
+
+def make_list_resources_tool(functions_module: Any) -> Callable:
+    """
+    Build an aggregator tool that fetches several list endpoints concurrently,
+    so one model decision ("resolve these IDs") costs one coalesced network
+    step instead of one round-trip per list.
+    """
+    fetchers = {
+        kind: getattr(functions_module, attr)
+        for kind, attr in _LIST_RESOURCE_FUNCS.items()
+        if hasattr(functions_module, attr)
+    }
+
+    async def _call(fetch: Callable) -> Any:
+        if inspect.iscoroutinefunction(fetch):
+            return await fetch()
+        return await asyncio.to_thread(fetch)
+
+    async def list_resources(kinds: list):
+        """
+        Fetch several MNotify list endpoints in one call.
+
+        Args:
+            kinds (list): Any of 'groups', 'templates', 'contacts',
+                'scheduled', 'balance'
+
+        Returns:
+            dict: One entry per requested kind with that endpoint's payload;
+                unknown kinds get an {'error': ...} entry.
+        """
+        requested = _to_str_list(kinds)
+        known = [k for k in requested if k in fetchers]
+        results = await asyncio.gather(
+            *(_call(fetchers[k]) for k in known), return_exceptions=True
+        )
+        out: Dict[str, Any] = {}
+        for kind, result in zip(known, results):
+            out[kind] = {"error": f"Request failed: {result}"} if isinstance(result, Exception) else result
+        for kind in requested:
+            if kind not in fetchers:
+                out[kind] = {"error": f"Unknown resource kind: {kind}"}
+        return out
+
+    return list_resources
+
+
+@functools.lru_cache(maxsize=1)
 def default_overrides() -> Dict[str, FunctionOverride]:
-    """Overrides based on known docstrings and patterns."""
+    """Overrides based on known docstrings and patterns (built once, shared)."""
     overrides: Dict[str, FunctionOverride] = {}
 
     # SMS quick
@@ -337,8 +453,9 @@ def default_overrides() -> Dict[str, FunctionOverride]:
     return overrides
 
 
+@functools.lru_cache(maxsize=1)
 def default_aliases() -> Dict[str, Dict[str, str]]:
-    """Per-function param aliases."""
+    """Per-function param aliases (built once, shared)."""
     return {
         "send_quick_bulk_sms": {"recipients": "recipient"},
         "send_bulk_group_sms": {"groups": "group_id", "group_ids": "group_id"},
@@ -350,29 +467,35 @@ def register_flex_functions(
     functions_module: Any,
     overrides: Optional[Dict[str, FunctionOverride]] = None,
     aliases: Optional[Dict[str, Dict[str, str]]] = None,
-) -> List[str]:
+) -> Dict[str, Callable]:
     """
     Create and register flex wrappers for all public functions in the module.
 
-    Returns list of registered wrapper names.
+    Returns a mapping of wrapper name to the registered wrapper, so callers
+    can introspect the tools (docstrings, signatures) as the agent sees them.
     """
     overrides = overrides or default_overrides()
     aliases = aliases or default_aliases()
 
-    registered: List[str] = []
-    for name, func in inspect.getmembers(functions_module, inspect.isfunction):
-        if name.startswith("_"):
+    registered: Dict[str, Callable] = {}
+    # vars() avoids getmembers' dir()+getattr scan (and its sorting pass)
+    for name, func in vars(functions_module).items():
+        if name.startswith("_") or not inspect.isfunction(func):
             continue
-        # Only include functions defined in the target module 
-        if getattr(func, "__module__", None) != getattr(functions_module, "__name__", None):
+        # Only include functions defined in the target module
+        if func.__module__ != functions_module.__name__:
             continue
         # Skip utility functions not intended as tools
         if name in {"main", "safe_api_call", "validate_sms_request", "validate_contact_data"}:
             continue
 
         ov = overrides.get(name, FunctionOverride())
-        ov.aliases = {**aliases.get(name, {}), **ov.aliases}
-        wrapper = make_flex_wrapper(func, ov)
+        wrapper = make_flex_wrapper(func, ov, extra_aliases=aliases.get(name))
         agent.add_tool(wrapper)
-        registered.append(wrapper.__name__)
+        registered[wrapper.__name__] = wrapper
+
+    # Aggregator over the list endpoints: one tool call, concurrent fetches
+    list_resources = make_list_resources_tool(functions_module)
+    agent.add_tool(list_resources)
+    registered[list_resources.__name__] = list_resources
     return registered